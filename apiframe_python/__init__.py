@@ -1 +1,2 @@
-from .main import ApiframeClient
\ No newline at end of file
+from .main import ApiframeClient
+from .models import ApiError, ApiframeResponse, TaskSubmission, TaskResult, Account
@@ -1,15 +1,58 @@
 import requests
 
+from .models import Account, TaskResult, TaskSubmission
+
+ENDPOINTS = (
+    'imagine', 'upscale-1x', 'upscale-alt', 'upscale-highres', 'reroll', 'variations', 'inpaint', 'outpaint',
+    'pan', 'describe', 'blend', 'seed', 'faceswap', 'fetch', 'fetch-many', 'account',
+)
+
+def _check_timeout(timeout, endpoint=None):
+    """
+    Make sure a timeout is a positive number of seconds or a (connect, read) tuple of positive numbers.
+    """
+
+    values = timeout if isinstance(timeout, tuple) and len(timeout) == 2 else (timeout,)
+
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0 for value in values):
+        where = f' for {endpoint!r}' if endpoint else ''
+        raise ValueError(f'Invalid timeout{where}: {timeout!r}. Use a positive number of seconds or a (connect, read) tuple.')
+
+    return timeout
+
 class ApiframeClient:
-    def __init__(self, api_key, verbose=False):
+    def __init__(self, api_key, verbose=False, timeout=(10, 60), timeouts=None):
         self.base_url = 'https://api.apiframe.pro'
         self.api_key = api_key
         self.verbose = verbose
+        self.timeout = _check_timeout(timeout)
+        self.timeouts = {}
 
         if not api_key:
             raise ValueError('The api_key is required!')
 
-    def imagine(self, prompt, aspect_ratio='1:1', process_mode='fast', webhook_url=None, webhook_secret=None):
+        # Accept both endpoint paths ('fetch-many') and method names ('fetch_many').
+        for key, value in (timeouts or {}).items():
+            endpoint = key.replace('_', '-')
+            if endpoint not in ENDPOINTS:
+                raise ValueError(f'Unknown endpoint in timeouts: {key!r}')
+            if endpoint in self.timeouts:
+                raise ValueError(f'Timeout for {endpoint!r} is given more than once in timeouts')
+            self.timeouts[endpoint] = _check_timeout(value, key)
+
+    def _timeout(self, endpoint, timeout=None):
+        """
+        Get the requests timeout for an endpoint: a (connect, read) tuple or a single number of seconds.
+        A per-call `timeout` wins over per-endpoint values passed in `timeouts` (e.g. {'fetch_many': (5, 15)}),
+        which win over the default `timeout`.
+        """
+
+        if timeout is not None:
+            return _check_timeout(timeout)
+
+        return self.timeouts.get(endpoint, self.timeout)
+
+    def imagine(self, prompt, aspect_ratio='1:1', process_mode='fast', webhook_url=None, webhook_secret=None, timeout=None):
         """
         Generate an image using a text prompt. This is the /imagine command on Discord.
 
@@ -20,11 +63,12 @@ class ApiframeClient:
             process_mode (str, optional): Generation mode to use for the generation. Can be 'fast' or 'turbo'. Default is 'fast'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -39,20 +83,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('imagine', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/imagine', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/imagine', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def upscale_1x(self, parent_task_id, index, webhook_url=None, webhook_secret=None):
+    def upscale_1x(self, parent_task_id, index, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Upscale one of the 4 generated images by the Imagine endpoint to get a single image.
@@ -63,11 +109,12 @@ class ApiframeClient:
             index (str): The index of the image to upscale. Can be 1, 2, 3, or 4.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -81,20 +128,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('upscale-1x', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/upscale-1x', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/upscale-1x', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def upscale_alt(self, parent_task_id, type, webhook_url=None, webhook_secret=None):
+    def upscale_alt(self, parent_task_id, type, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         The Upscale (Subtle) option doubles the size of your image and keeps details very similar to the original. The Upscale (Creative) option adds details to the image. You need to upscale 1x first.
@@ -105,11 +154,12 @@ class ApiframeClient:
             type (str): The type of upscale. Can be 'subtle' or 'creative'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -123,20 +173,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('upscale-alt', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/upscale-alt', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/upscale-alt', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def upscale_highres(self, parent_task_id, type, webhook_url=None, webhook_secret=None):
+    def upscale_highres(self, parent_task_id, type, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Upscale any image to a higher resolution. The image must not be larger than 2048x2048.
@@ -147,11 +199,12 @@ class ApiframeClient:
             type (str): The type of upscale. Can be '2x' or '4x'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -165,20 +218,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('upscale-highres', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/upscale-highres', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/upscale-highres', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def reroll(self, parent_task_id, prompt=None, aspect_ratio='1:1', webhook_url=None, webhook_secret=None):
+    def reroll(self, parent_task_id, prompt=None, aspect_ratio='1:1', webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Reroll to create new images from a previous Imagine task.
@@ -190,11 +245,12 @@ class ApiframeClient:
             aspect_ratio (str, optional): Aspect ratio for the image. Default is '1:1'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -208,20 +264,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('reroll', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/reroll', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/reroll', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def variations(self, parent_task_id, index, prompt=None, aspect_ratio='1:1', webhook_url=None, webhook_secret=None):
+    def variations(self, parent_task_id, index, prompt=None, aspect_ratio='1:1', webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Create 4 new variations of one of the 4 generated images by the Imagine request.
@@ -234,11 +292,12 @@ class ApiframeClient:
             aspect_ratio (str, optional): Aspect ratio for the image. Default is '1:1'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -253,20 +312,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('variations', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/variations', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/variations', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def inpaint(self, parent_task_id, mask, prompt=None, webhook_url=None, webhook_secret=None):
+    def inpaint(self, parent_task_id, mask, prompt=None, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Redraw a selected area of an image. You need to upscale 1x first. (Vary Region)
@@ -278,11 +339,12 @@ class ApiframeClient:
             prompt (str, optional): Drawing prompt for selected areas.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -296,20 +358,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('inpaint', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/inpaint', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/inpaint', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def outpaint(self, parent_task_id, zoom_ratio, aspect_ratio='1:1', prompt=None, webhook_url=None, webhook_secret=None):
+    def outpaint(self, parent_task_id, zoom_ratio, aspect_ratio='1:1', prompt=None, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         The outpaint endpoint enlarges an image's canvas beyond its original size while keeping the contents of the original image unchanged. You need to upscale 1x first. (Zoom Out)
@@ -322,11 +386,12 @@ class ApiframeClient:
             prompt (str, optional): Drawing prompt for new areas.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -341,20 +406,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('outpaint', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/outpaint', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/outpaint', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def pan(self, parent_task_id, direction, prompt=None, webhook_url=None, webhook_secret=None):
+    def pan(self, parent_task_id, direction, prompt=None, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Broadens the image canvas in a specific direction, keeping the original content intact and using prompts and the original image as guides for filling the expanded area. You first need to Upscale 1x.
@@ -366,11 +433,12 @@ class ApiframeClient:
             prompt (str, optional): Drawing prompt for new areas.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -384,20 +452,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('pan', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/pan', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/pan', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def describe(self, image_url, process_mode='fast', webhook_url=None, webhook_secret=None):
+    def describe(self, image_url, process_mode='fast', webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Writes four example prompts based on an image you upload. This is the same as using the /describe command in Discord.
@@ -408,11 +478,12 @@ class ApiframeClient:
             process_mode (str, optional): Generation mode to use for the generation. Can be 'fast' or 'turbo'. Default is 'fast'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -426,20 +497,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('describe', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/describe', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/describe', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def blend(self, image_urls, dimension='square', process_mode='fast', webhook_url=None, webhook_secret=None):
+    def blend(self, image_urls, dimension='square', process_mode='fast', webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Blend multiple images into one image.
@@ -451,11 +524,12 @@ class ApiframeClient:
             dimension (str, optional): Can be 'square', 'portrait', or 'landscape'. Default is 'square'.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -470,20 +544,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('blend', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/blend', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/blend', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def seed(self, task_id, webhook_url=None, webhook_secret=None):
+    def seed(self, task_id, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Get the seed of a generated image.
@@ -493,11 +569,12 @@ class ApiframeClient:
             task_id (str): The task_id of the task.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -510,20 +587,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('seed', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/seed', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/seed', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def faceswap(self, target_image_url, swap_image_url, webhook_url=None, webhook_secret=None):
+    def faceswap(self, target_image_url, swap_image_url, webhook_url=None, webhook_secret=None, timeout=None):
 
         """
         Swap the face on a target image with the face on a provided image. Each image must contain only one face.
@@ -534,11 +613,12 @@ class ApiframeClient:
             swap_image_url (str): The URL of the image where the new face should be taken from.
             webhook_url (str, optional): The final result of this task will be posted at this URL.
             webhook_secret (str, optional): Will be passed as x-webhook-secret in the webhook call headers for authentication.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        dict: A dictionary containing task_id and errors.
+        TaskSubmission: A dict-like object containing task_id and errors.
             task_id (str): The ID of the task.
-            errors (list of dict): A list of errors, where each error is represented as a dictionary with a 'msg' key.
+            errors (list of dict): A list of errors, where each error is a dictionary with a 'msg' key. The errors attribute gives them as a tuple of ApiError.
         """
 
         data = {
@@ -552,20 +632,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('faceswap', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/faceswap', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/faceswap', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskSubmission.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def fetch(self, task_id):
+    def fetch(self, task_id, timeout=None):
 
         """
         Get the result/status of a submitted task.
@@ -573,9 +655,10 @@ class ApiframeClient:
         Parameters:
         options (dict): The options dictionary.
             task_id (str): The task_id of the task.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        Promise[object]: A promise containing the result/status of the task.
+        TaskResult: A dict-like object containing the result/status of the task.
         """
 
         data = {
@@ -587,20 +670,22 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('fetch', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/fetch', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/fetch', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return TaskResult.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
 
 
-    def fetch_many(self, task_ids):
+    def fetch_many(self, task_ids, timeout=None):
 
         """
         Get the results/statuses of multiple tasks using their task_id.
@@ -608,9 +693,10 @@ class ApiframeClient:
         Parameters:
         options (dict): The options dictionary.
             task_ids (list of str): The task ids of the tasks, min 2 and max 20.
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
 
         Returns:
-        Promise[list of object]: A promise containing a list of results/statuses of the tasks.
+        list of TaskResult: A list of dict-like objects containing the results/statuses of the tasks.
         """
 
         data = {
@@ -622,26 +708,31 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('fetch-many', timeout)
+
         try:
-            response = requests.post(f'{self.base_url}/fetch-many', json=data, headers=headers)
+            response = requests.post(f'{self.base_url}/fetch-many', json=data, headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return [TaskResult.parse(item) for item in response_data] if isinstance(response_data, list) else TaskResult.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
  
 
-    def account(self):
+    def account(self, timeout=None):
 
         """
         Get details about your account: credits remaining, stats, etc..
 
+        Parameters:
+            timeout (float or tuple, optional): Timeout for this call in seconds, or a (connect, read) tuple. Default is the client's timeout for this endpoint.
+
         Returns:
-        Promise[dict]: A promise containing account details.
+        Account: A dict-like object containing account details.
             email (str): The email associated with the account.
             credits (int): The remaining credits.
             plan (str): The plan of the account.
@@ -654,14 +745,16 @@ class ApiframeClient:
             'Content-Type': 'application/json',
         }
 
+        timeout = self._timeout('account', timeout)
+
         try:
-            response = requests.get(f'{self.base_url}/account', headers=headers)
+            response = requests.get(f'{self.base_url}/account', headers=headers, timeout=timeout)
             response_data = response.json()
 
             if self.verbose:
                 print({'response': response_data})
 
-            return response_data
+            return Account.parse(response_data)
         except Exception as e:
             print('\n[ERROR]', e, '\n')
             return
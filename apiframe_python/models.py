@@ -0,0 +1,255 @@
+class ApiframeResponse:
+    """
+    Compact wrapper around a JSON object returned by the API.
+
+    Known fields are kept in __slots__ instead of a per-instance dict, and unknown
+    fields are kept in a small side dict so nothing returned by the API is lost.
+    Item access (result['errors'], result.get('image_urls')) returns the values exactly
+    as the API sent them. Attribute access (result.errors, result.image_urls) parses
+    nested fields into ApiError objects and tuples on first read and caches them;
+    setting or deleting the item clears the cache.
+
+    These objects are not dict instances: use to_dict() for json.dumps or isinstance checks.
+    """
+
+    __slots__ = ('_extra',)
+
+    _fields = ()
+    _slots = {}
+    _caches = {}
+
+    def __init__(self, data):
+        if not isinstance(data, dict):
+            raise TypeError(f'{type(self).__name__} expects a dict, got {type(data).__name__}')
+
+        self._extra = None
+
+        for key, value in data.items():
+            self[key] = value
+
+    @classmethod
+    def parse(cls, data):
+        """
+        Wrap a JSON body in this class. Anything that is not a JSON object is returned as is.
+        """
+
+        return cls(data) if isinstance(data, dict) else data
+
+    @classmethod
+    def _slot(cls, key):
+        return cls._slots.get(key, key)
+
+    def __getattr__(self, name):
+        # Only reached when a slot was never set: the API did not return that field.
+        if name in self._fields:
+            return None
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    def __reduce__(self):
+        # The default slot state would read unset slots through __getattr__ and store them as None.
+        return (type(self), (self.to_dict(),))
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            try:
+                return object.__getattribute__(self, self._slot(key))
+            except AttributeError:
+                raise KeyError(key) from None
+
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def _cached(self, key, parse):
+        slot = self._caches[key]
+        try:
+            return object.__getattribute__(self, slot)
+        except AttributeError:
+            value = parse(self.get(key))
+            object.__setattr__(self, slot, value)
+            return value
+
+    def _clear_cache(self, key):
+        slot = self._caches.get(key)
+        if slot is not None:
+            try:
+                object.__delattr__(self, slot)
+            except AttributeError:
+                pass
+
+    def __setitem__(self, key, value):
+        self._clear_cache(key)
+        if key in self._fields:
+            object.__setattr__(self, self._slot(key), value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        self._clear_cache(key)
+        if key in self._fields:
+            try:
+                object.__delattr__(self, self._slot(key))
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = [key for key in self._fields if key in self]
+        if self._extra is not None:
+            keys.extend(self._extra)
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, ApiframeResponse):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+    def to_dict(self):
+        """
+        Convert back to the plain dict returned by the API.
+        """
+
+        return dict(self.items())
+
+
+class ApiError(ApiframeResponse):
+    """
+    An error returned by the API, e.g. {'msg': 'Invalid prompt'}.
+    """
+
+    __slots__ = ('msg',)
+
+    _fields = ('msg',)
+
+    def __str__(self):
+        return str(self.msg)
+
+
+def _parse_errors(errors):
+    if not errors:
+        return ()
+    if isinstance(errors, (str, dict)):
+        errors = [errors]
+    return tuple(ApiError(error) if isinstance(error, dict) else ApiError({'msg': error}) for error in errors)
+
+
+def _parse_urls(urls):
+    return None if urls is None else tuple(urls)
+
+
+class _WithErrors(ApiframeResponse):
+    __slots__ = ('_errors', '_parsed_errors')
+
+    _slots = {'errors': '_errors'}
+    _caches = {'errors': '_parsed_errors'}
+
+    @property
+    def errors(self):
+        """
+        tuple of ApiError: The errors returned by the API, empty if there are none.
+        """
+
+        return self._cached('errors', _parse_errors)
+
+    @property
+    def ok(self):
+        """
+        True when the API did not return any errors.
+        """
+
+        return not self.get('errors')
+
+
+class TaskSubmission(_WithErrors):
+    """
+    Response of an endpoint that submits a task (imagine, upscale_1x, variations, etc.).
+
+    Attributes:
+        task_id (str): The ID of the task.
+        errors (tuple of ApiError): The errors returned by the API, empty if there are none.
+    """
+
+    __slots__ = ('task_id',)
+
+    _fields = ('task_id', 'errors')
+
+
+class TaskResult(_WithErrors):
+    """
+    Result/status of a task, as returned by fetch and fetch_many.
+
+    Attributes:
+        task_id (str): The ID of the task.
+        task_type (str): The type of the task (imagine, upscale-1x, etc.).
+        status (str): The status of the task (pending, processing, finished, etc.).
+        percentage (str): The progress of the task while it is processing.
+        original_image_url (str): The URL of the grid image.
+        image_url (str): The URL of the image, for single image tasks.
+        image_urls (tuple of str): The URLs of the generated images.
+        errors (tuple of ApiError): The errors returned by the API, empty if there are none.
+    """
+
+    __slots__ = ('task_id', 'task_type', 'status', 'percentage', 'original_image_url', 'image_url', '_image_urls', '_parsed_image_urls', 'actions', 'content', 'seed', 'message')
+
+    _fields = ('task_id', 'task_type', 'status', 'percentage', 'original_image_url', 'image_url', 'image_urls', 'actions', 'content', 'seed', 'message', 'errors')
+    _slots = {'errors': '_errors', 'image_urls': '_image_urls'}
+    _caches = {'errors': '_parsed_errors', 'image_urls': '_parsed_image_urls'}
+
+    @property
+    def image_urls(self):
+        return self._cached('image_urls', _parse_urls)
+
+
+class Account(_WithErrors):
+    """
+    Details about your account, as returned by account.
+
+    Attributes:
+        email (str): The email associated with the account.
+        credits (int): The remaining credits.
+        plan (str): The plan of the account.
+        next_billing_date (str or None): The next billing date, or None if not applicable.
+        total_images (int): The total number of images.
+        errors (tuple of ApiError): The errors returned by the API, empty if there are none.
+    """
+
+    __slots__ = ('email', 'credits', 'plan', 'next_billing_date', 'total_images')
+
+    _fields = ('email', 'credits', 'plan', 'next_billing_date', 'total_images', 'errors')
@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from apiframe_python import ApiframeClient
+from apiframe_python.main import ENDPOINTS
+
+CALLS = {
+    'imagine': lambda client, **kwargs: client.imagine('a prompt', **kwargs),
+    'upscale-1x': lambda client, **kwargs: client.upscale_1x('parent', '1', **kwargs),
+    'upscale-alt': lambda client, **kwargs: client.upscale_alt('parent', 'subtle', **kwargs),
+    'upscale-highres': lambda client, **kwargs: client.upscale_highres('parent', '2x', **kwargs),
+    'reroll': lambda client, **kwargs: client.reroll('parent', **kwargs),
+    'variations': lambda client, **kwargs: client.variations('parent', '1', **kwargs),
+    'inpaint': lambda client, **kwargs: client.inpaint('parent', 'mask', **kwargs),
+    'outpaint': lambda client, **kwargs: client.outpaint('parent', '2', **kwargs),
+    'pan': lambda client, **kwargs: client.pan('parent', 'up', **kwargs),
+    'describe': lambda client, **kwargs: client.describe('https://example.com/image.png', **kwargs),
+    'blend': lambda client, **kwargs: client.blend(['a', 'b'], **kwargs),
+    'seed': lambda client, **kwargs: client.seed('task', **kwargs),
+    'faceswap': lambda client, **kwargs: client.faceswap('a', 'b', **kwargs),
+    'fetch': lambda client, **kwargs: client.fetch('task', **kwargs),
+    'fetch-many': lambda client, **kwargs: client.fetch_many(['a', 'b'], **kwargs),
+    'account': lambda client, **kwargs: client.account(**kwargs),
+}
+
+
+class TimeoutTest(unittest.TestCase):
+    def call(self, client, endpoint, **kwargs):
+        method = 'get' if endpoint == 'account' else 'post'
+        with mock.patch(f'apiframe_python.main.requests.{method}') as request:
+            request.return_value.json.return_value = {'task_id': 'a'}
+            CALLS[endpoint](client, **kwargs)
+        self.assertTrue(request.call_args.args[0].endswith('/' + endpoint))
+        return request.call_args.kwargs['timeout']
+
+    def test_calls_cover_every_endpoint(self):
+        self.assertEqual(set(CALLS), set(ENDPOINTS))
+
+    def test_default_timeout(self):
+        client = ApiframeClient('key')
+        for endpoint in ENDPOINTS:
+            self.assertEqual(self.call(client, endpoint), (10, 60), endpoint)
+
+    def test_per_endpoint_timeouts(self):
+        client = ApiframeClient('key', timeout=30, timeouts={endpoint: (1, i + 1) for i, endpoint in enumerate(ENDPOINTS)})
+        for i, endpoint in enumerate(ENDPOINTS):
+            self.assertEqual(self.call(client, endpoint), (1, i + 1), endpoint)
+
+    def test_per_call_timeout(self):
+        client = ApiframeClient('key', timeouts={'fetch': 5})
+        for endpoint in ENDPOINTS:
+            self.assertEqual(self.call(client, endpoint, timeout=(2, 3)), (2, 3), endpoint)
+        self.assertEqual(self.call(client, 'fetch'), 5)
+
+    def test_method_names_and_paths(self):
+        self.assertEqual(self.call(ApiframeClient('key', timeouts={'fetch_many': 7}), 'fetch-many'), 7)
+        self.assertEqual(self.call(ApiframeClient('key', timeouts={'fetch-many': 7}), 'fetch-many'), 7)
+        self.assertEqual(self.call(ApiframeClient('key', timeouts={'upscale_1x': 7}), 'upscale-1x'), 7)
+
+    def test_both_spellings_raise(self):
+        with self.assertRaises(ValueError):
+            ApiframeClient('key', timeouts={'fetch_many': 5, 'fetch-many': 7})
+
+    def test_unknown_endpoint_raises(self):
+        with self.assertRaises(ValueError):
+            ApiframeClient('key', timeouts={'fetchmany': 5})
+
+    def test_invalid_timeouts_raise(self):
+        for timeout in (None, 0, -1, 'abc', True, (10,), (10, 20, 30), (10, None), [10, 20]):
+            with self.assertRaises(ValueError, msg=repr(timeout)):
+                ApiframeClient('key', timeout=timeout)
+            with self.assertRaises(ValueError, msg=repr(timeout)):
+                ApiframeClient('key', timeouts={'fetch': timeout})
+        for timeout in (0, 'abc', (10,)):
+            with self.assertRaises(ValueError, msg=repr(timeout)):
+                ApiframeClient('key').fetch('task', timeout=timeout)
+
+    def test_valid_timeouts(self):
+        for timeout in (5, 2.5, (3, 10), (0.5, 7.5)):
+            self.assertEqual(ApiframeClient('key', timeout=timeout).timeout, timeout)
+
+
+if __name__ == '__main__':
+    unittest.main()
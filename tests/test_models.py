@@ -0,0 +1,119 @@
+import copy
+import pickle
+import unittest
+
+from apiframe_python.models import Account, ApiError, TaskResult, TaskSubmission
+
+
+class TaskResultTest(unittest.TestCase):
+    def setUp(self):
+        self.data = {'task_id': 'a', 'status': 'finished', 'image_urls': ['u1', 'u2'], 'foo': 1}
+        self.result = TaskResult(self.data)
+
+    def test_item_access(self):
+        self.assertEqual(self.result['task_id'], 'a')
+        self.assertEqual(self.result['image_urls'], ['u1', 'u2'])
+        self.assertEqual(self.result['foo'], 1)
+        self.assertEqual(self.result.get('percentage', 'x'), 'x')
+        with self.assertRaises(KeyError):
+            self.result['percentage']
+        with self.assertRaises(KeyError):
+            self.result['nope']
+
+    def test_attribute_access(self):
+        self.assertEqual(self.result.task_id, 'a')
+        self.assertIsNone(self.result.percentage)
+        with self.assertRaises(AttributeError):
+            self.result.nope
+
+    def test_mapping_protocol(self):
+        self.assertIn('status', self.result)
+        self.assertNotIn('percentage', self.result)
+        self.assertEqual(self.result.keys(), ['task_id', 'status', 'image_urls', 'foo'])
+        self.assertEqual(len(self.result), 4)
+        self.assertEqual(dict(self.result), self.data)
+
+    def test_set_and_delete_items(self):
+        self.result['status'] = 'failed'
+        self.result['bar'] = 2
+        self.assertEqual(self.result.status, 'failed')
+        self.assertEqual(self.result['bar'], 2)
+        del self.result['status']
+        self.assertNotIn('status', self.result)
+        with self.assertRaises(KeyError):
+            del self.result['status']
+
+    def test_to_dict_and_equality(self):
+        self.assertEqual(self.result.to_dict(), self.data)
+        self.assertEqual(self.result, self.data)
+        self.assertEqual(self.result, TaskResult(self.result.to_dict()))
+        self.assertNotEqual(self.result, TaskSubmission({'task_id': 'a'}))
+
+    def test_unknown_fields_go_to_extra(self):
+        self.assertEqual(self.result._extra, {'foo': 1})
+        self.assertIsNone(TaskResult({'task_id': 'a'})._extra)
+        self.assertFalse(hasattr(self.result, '__dict__'))
+
+    def test_image_urls_are_parsed_on_attribute_access(self):
+        self.assertEqual(self.result.image_urls, ('u1', 'u2'))
+        self.assertEqual(self.result['image_urls'], ['u1', 'u2'])
+        self.assertIsNone(TaskResult({}).image_urls)
+
+    def test_parsed_values_are_cached_until_the_item_changes(self):
+        urls = self.result.image_urls
+        self.assertIs(self.result.image_urls, urls)
+        self.result['image_urls'] = ['u3']
+        self.assertEqual(self.result.image_urls, ('u3',))
+        del self.result['image_urls']
+        self.assertIsNone(self.result.image_urls)
+
+    def test_copy_and_pickle_keep_unset_fields_unset(self):
+        result = TaskResult({'task_id': 'a', 'errors': [{'msg': 'bad'}], 'foo': 1})
+        for clone in (copy.copy(result), copy.deepcopy(result), pickle.loads(pickle.dumps(result))):
+            self.assertIsInstance(clone, TaskResult)
+            self.assertEqual(clone, result)
+            self.assertEqual(clone.to_dict(), {'task_id': 'a', 'errors': [{'msg': 'bad'}], 'foo': 1})
+            self.assertNotIn('status', clone)
+
+
+class ErrorsTest(unittest.TestCase):
+    def test_errors_are_parsed_on_attribute_access(self):
+        task = TaskSubmission({'errors': [{'msg': 'bad'}]})
+        self.assertFalse(task.ok)
+        self.assertEqual(task.errors, (ApiError({'msg': 'bad'}),))
+        self.assertEqual(str(task.errors[0]), 'bad')
+        self.assertEqual(task['errors'], [{'msg': 'bad'}])
+        self.assertIs(task.errors, task.errors)
+        task['errors'] = []
+        self.assertEqual(task.errors, ())
+        self.assertTrue(task.ok)
+
+    def test_api_error_has_no_ok(self):
+        with self.assertRaises(AttributeError):
+            ApiError({'msg': 'bad'}).ok
+
+    def test_single_error_values(self):
+        self.assertEqual(TaskSubmission({'errors': 'bad'}).errors, (ApiError({'msg': 'bad'}),))
+        self.assertEqual(TaskSubmission({'errors': {'msg': 'bad'}}).errors, (ApiError({'msg': 'bad'}),))
+
+    def test_no_errors(self):
+        task = TaskSubmission({'task_id': 'a', 'errors': None})
+        self.assertTrue(task.ok)
+        self.assertEqual(task.errors, ())
+        self.assertEqual(task.to_dict(), {'task_id': 'a', 'errors': None})
+        self.assertEqual(Account({'credits': 3}).errors, ())
+
+
+class ParseTest(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(Account.parse({'credits': 3}).credits, 3)
+        self.assertEqual(Account.parse(['not', 'a', 'dict']), ['not', 'a', 'dict'])
+        self.assertIsNone(Account.parse(None))
+
+    def test_init_rejects_non_dict(self):
+        with self.assertRaises(TypeError):
+            TaskResult(['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()